@@ -8,15 +8,23 @@ import os
 import sys
 import csv
 import re
+import json
+import itertools
+import time
+import threading
+import queue
+import subprocess
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, NamedTuple, Optional, Tuple
 
 # External dependencies
 try:
     import yt_dlp
-    import whisper
-    import pydub
-    from pydub import AudioSegment
+    from faster_whisper import WhisperModel
+    from faster_whisper.vad import VadOptions, get_speech_timestamps
+    import numpy as np
     from tqdm import tqdm
     import tempfile
     import os
@@ -28,6 +36,75 @@ except ImportError as e:
     sys.exit(1)
 
 
+# Parallel audio downloads feeding the transcriber, and videos per model call
+DOWNLOAD_WORKERS = 4
+TRANSCRIBE_BATCH_SIZE = 8
+# Concurrent faster-whisper transcriptions sharing one loaded model
+TRANSCRIBE_WORKERS = 2
+# Parallel metadata lookups for channel entries the listing left incomplete
+METADATA_WORKERS = 8
+
+# Cached video metadata and transcripts expire after a week
+CACHE_TTL = 7 * 24 * 3600
+
+# Every supported YouTube URL form in one pattern, compiled once at import;
+# the named group that matched tells whether it is a video or a channel
+_URL_RE = re.compile(
+    r'youtube\.com/(?:watch\?v=|embed/|v/|shorts/)(?P<video>[^&\n?#]+)'
+    r'|youtu\.be/(?P<short>[^&\n?#]+)'
+    r'|youtube\.com/(?:channel/|c/|user/|@)(?P<channel>[^/\n?#]+)'
+)
+
+# Whisper models expect 16 kHz mono input
+SAMPLE_RATE = 16000
+
+# Silero VAD settings: pauses shorter than this stay inside a speech chunk
+VAD_PARAMETERS = {"min_silence_duration_ms": 500}
+
+
+class VideoInfo(NamedTuple):
+    """Video metadata shown in the console and written to the CSV"""
+    title: str
+    view_count: int
+    duration: int
+
+
+def parse_youtube_url(url: str) -> Optional[Tuple[str, str]]:
+    """Classify a YouTube URL as ('video', id) or ('channel', id) in one scan"""
+    match = _URL_RE.search(url)
+    if not match:
+        return None
+    if match.group('channel'):
+        return 'channel', match.group('channel')
+    return 'video', match.group('video') or match.group('short')
+
+
+def _load_audio(source: str, http_headers: Optional[Dict] = None) -> "np.ndarray":
+    """Decode an audio file or media URL to 16 kHz mono float32 samples with FFmpeg"""
+    cmd = ["ffmpeg", "-nostdin", "-threads", "0"]
+    if http_headers:
+        cmd += ["-headers", "".join(f"{k}: {v}\r\n" for k, v in http_headers.items())]
+    cmd += [
+        "-i", source,
+        "-f", "s16le", "-ac", "1", "-acodec", "pcm_s16le", "-ar", str(SAMPLE_RATE), "-",
+    ]
+    out = subprocess.run(cmd, capture_output=True)
+    if out.returncode != 0:
+        raise RuntimeError(f"FFmpeg failed to decode audio: {out.stderr.decode(errors='ignore')[-200:]}")
+    # Scale in place so the float32 copy is the only new buffer
+    audio = np.frombuffer(out.stdout, np.int16).astype(np.float32)
+    audio /= 32768.0
+    return audio
+
+
+def _drop_silence(audio: "np.ndarray") -> "np.ndarray":
+    """Keep only the speech regions Silero VAD finds, concatenated"""
+    speech = get_speech_timestamps(audio, vad_options=VadOptions(**VAD_PARAMETERS))
+    if not speech:
+        return audio
+    return np.concatenate([audio[chunk["start"]:chunk["end"]] for chunk in speech])
+
+
 class YouTubeTranscriptScraper:
     """Main class for scraping YouTube transcripts using AI transcription"""
     
@@ -36,6 +113,58 @@ class YouTubeTranscriptScraper:
         # Create YouTube_Transcripts folder in the program directory
         self.output_dir = Path(__file__).parent / "YouTube_Transcripts"
         self.setup_output_directory()
+        
+        # yt-dlp instances reused across videos, one per thread and option
+        # set (YoutubeDL is not thread-safe); all are kept for closing
+        self._ydl_local = threading.local()
+        self._ydl_all = []
+        self._ydl_lock = threading.Lock()
+        
+        # On-disk cache of metadata/transcripts so re-runs skip the network
+        self.cache_dir = self.output_dir / ".cache"
+        self.cache_dir.mkdir(exist_ok=True)
+    
+    def __del__(self):
+        """Close cached yt-dlp instances"""
+        for ydl in getattr(self, '_ydl_all', ()):
+            try:
+                ydl.close()
+            except Exception:
+                pass
+    
+    def _cache_get(self, key: str) -> Optional[Dict]:
+        """Return a cached value, or None if missing or expired"""
+        path = self.cache_dir / f"{key}.json"
+        try:
+            if time.time() - path.stat().st_mtime > CACHE_TTL:
+                return None
+            return json.loads(path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return None
+    
+    def _cache_set(self, key: str, value: Dict):
+        """Store a value in the on-disk cache"""
+        try:
+            (self.cache_dir / f"{key}.json").write_text(json.dumps(value), encoding='utf-8')
+        except OSError as e:
+            tqdm.write(f"Could not write cache: {e}")
+    
+    def _transcript_key(self, video_id: str) -> str:
+        """Cache key for a transcript made by the currently loaded backend and model"""
+        return f"transcript_{self.loaded_backend}_{self.model_name}_{video_id}"
+    
+    def _get_ydl(self, opts_key: str, opts: Dict) -> "yt_dlp.YoutubeDL":
+        """Return this thread's YoutubeDL for an option set, creating it on first use"""
+        instances = getattr(self._ydl_local, 'instances', None)
+        if instances is None:
+            instances = self._ydl_local.instances = {}
+        
+        ydl = instances.get(opts_key)
+        if ydl is None:
+            ydl = instances[opts_key] = yt_dlp.YoutubeDL(opts)
+            with self._ydl_lock:
+                self._ydl_all.append(ydl)
+        return ydl
     
     def setup_output_directory(self):
         """Setup the output directory, checking if it already exists"""
@@ -54,22 +183,123 @@ class YouTubeTranscriptScraper:
         
         print(f"Output directory: {self.output_dir}")
         
-        # Initialize Whisper model
+        # Initialize Whisper model (faster-whisper model, or HF model + processor)
         self.whisper_model = None
+        self.hf_model = None
+        self.hf_processor = None
+        self.hf_device = "cuda"
         self.model_name = "base"  # Default model
+        self.backend = "faster-whisper"
+        # Backend the loaded model actually runs on: large-v3 on CUDA goes
+        # through Transformers whatever self.backend says
+        self.loaded_backend = None
+        # Concurrent transcriptions the model is loaded for (channel mode only)
+        self.transcribe_workers = 1
         
     def load_whisper_model(self, model_name: str = "base"):
-        """Load Whisper model for transcription"""
+        """Load Whisper model for transcription, picking a backend per model"""
         try:
             print(f"Loading Whisper model: {model_name}")
-            self.whisper_model = whisper.load_model(model_name)
+            if self.backend == "onnx":
+                self._load_onnx_model(model_name)
+            elif model_name == "large-v3" and torch.cuda.is_available():
+                try:
+                    self._load_hf_model(model_name)
+                except ImportError:
+                    print("transformers not installed, using faster-whisper instead")
+                    self._load_faster_whisper(model_name)
+            else:
+                self._load_faster_whisper(model_name)
             self.model_name = model_name
             print(f"✅ Whisper model '{model_name}' loaded successfully")
             return True
         except Exception as e:
-            print(f"❌ Error loading Whisper model: {e}")
+            tqdm.write(f"❌ Error loading Whisper model: {e}")
             return False
     
+    def _load_faster_whisper(self, model_name: str):
+        """Load model through faster-whisper (CTranslate2, INT8 quantized)"""
+        cuda = torch.cuda.is_available()
+        # int8_float16 on GPU: plain int8 there is no faster than FP16.
+        # num_workers lets several threads transcribe on the one model;
+        # cpu_threads is per worker, so the cores are split between them
+        workers = self.transcribe_workers
+        self.whisper_model = WhisperModel(
+            model_name,
+            device="cuda" if cuda else "cpu",
+            compute_type="int8_float16" if cuda else "int8",
+            cpu_threads=max(1, (os.cpu_count() or 1) // workers),
+            num_workers=workers,
+        )
+        self.hf_model = None
+        self.hf_processor = None
+        self.loaded_backend = "faster-whisper"
+    
+    def _load_hf_model(self, model_name: str):
+        """Load model through HF Transformers on GPU: FP16 encoder, INT8 decoder"""
+        from transformers import AutoProcessor, WhisperForConditionalGeneration
+        
+        model_id = f"openai/whisper-{model_name}"
+        processor = AutoProcessor.from_pretrained(model_id)
+        try:
+            import bitsandbytes  # noqa: F401
+            from transformers import BitsAndBytesConfig
+            
+            # Weight-only INT8 slows the encoder down but speeds up the
+            # decoder, so only decoder linears are quantized
+            quantization_config = BitsAndBytesConfig(
+                load_in_8bit=True,
+                llm_int8_skip_modules=["model.encoder", "proj_out"],
+            )
+            model = WhisperForConditionalGeneration.from_pretrained(
+                model_id, quantization_config=quantization_config,
+                torch_dtype=torch.float16, device_map="cuda",
+            )
+            print("Using FP16 encoder with INT8 decoder weights")
+        except ImportError:
+            model = WhisperForConditionalGeneration.from_pretrained(model_id, torch_dtype=torch.float16).to("cuda")
+            print("bitsandbytes not installed, using FP16 weights")
+        
+        # The encoder stays FP16 and always sees fixed 30 s windows, so it
+        # compiles to a single graph; the decoder's growing sequence would
+        # keep recompiling. Compilation is lazy and needs Triton (absent on
+        # Windows), or the first forward pass fails
+        if hasattr(torch, "compile") and importlib.util.find_spec("triton") is not None:
+            model.model.encoder = torch.compile(model.model.encoder)
+        
+        self.hf_model = model
+        self.hf_processor = processor
+        self.hf_device = "cuda"
+        self.loaded_backend = "transformers"
+        self.whisper_model = None
+    
+    def _load_onnx_model(self, model_name: str):
+        """Load model as 4-bit weight-quantized ONNX for ONNX Runtime on CPU"""
+        import onnx
+        from onnxruntime.quantization.matmul_nbits_quantizer import MatMulNBitsQuantizer
+        from optimum.onnxruntime import ORTModelForSpeechSeq2Seq
+        from transformers import AutoProcessor
+        
+        model_id = f"openai/whisper-{model_name}"
+        onnx_dir = self.cache_dir / "onnx" / model_name
+        
+        # Export and quantize once; later runs load the cached files
+        if not (onnx_dir / "encoder_model.onnx").exists():
+            print("Exporting model to ONNX (first run only)...")
+            ORTModelForSpeechSeq2Seq.from_pretrained(model_id, export=True).save_pretrained(onnx_dir)
+            for onnx_path in onnx_dir.glob("*.onnx"):
+                quantizer = MatMulNBitsQuantizer(
+                    onnx.load(str(onnx_path)), block_size=32, is_symmetric=True, bits=4
+                )
+                quantizer.process()
+                quantizer.model.save_model_to_file(str(onnx_path), use_external_data_format=True)
+        
+        self.hf_model = ORTModelForSpeechSeq2Seq.from_pretrained(onnx_dir, provider="CPUExecutionProvider")
+        self.hf_processor = AutoProcessor.from_pretrained(model_id)
+        self.hf_device = "cpu"
+        self.whisper_model = None
+        self.loaded_backend = "onnx"
+    
     def get_user_choice(self) -> str:
         """Get user's choice for scraping mode"""
         print("\n" + "="*60)
@@ -85,6 +315,23 @@ class YouTubeTranscriptScraper:
                 return choice
             print("Invalid choice. Please enter 1 or 2.")
     
+    def get_backend_choice(self) -> str:
+        """Get user's choice of CPU inference backend"""
+        print("\n" + "="*40)
+        print("CPU Backend Selection")
+        print("="*40)
+        print("No CUDA GPU found. Choose inference backend:")
+        print("1. faster-whisper - INT8 CTranslate2 (recommended)")
+        print("2. ONNX Runtime - 4-bit weights, smallest model (needs optimum[onnxruntime])")
+        
+        backend_map = {'1': 'faster-whisper', '2': 'onnx'}
+        
+        while True:
+            choice = input("\nEnter your choice (1 or 2): ").strip()
+            if choice in backend_map:
+                return backend_map[choice]
+            print("Invalid choice. Please enter 1 or 2.")
+    
     def get_whisper_model_choice(self) -> str:
         """Get user's choice for Whisper model"""
         print("\n" + "="*40)
@@ -113,83 +360,68 @@ class YouTubeTranscriptScraper:
     
     def extract_video_id(self, url: str) -> Optional[str]:
         """Extract video ID from YouTube URL"""
-        patterns = [
-            r'(?:https?://)?(?:www\.)?youtube\.com/watch\?v=([^&\n?#]+)',
-            r'(?:https?://)?(?:www\.)?youtube\.com/embed/([^&\n?#]+)',
-            r'(?:https?://)?(?:www\.)?youtube\.com/v/([^&\n?#]+)',
-            r'(?:https?://)?youtu\.be/([^&\n?#]+)',
-            r'(?:https?://)?(?:www\.)?youtube\.com/shorts/([^&\n?#]+)',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, url)
-            if match:
-                return match.group(1)
-        return None
+        parsed = parse_youtube_url(url)
+        return parsed[1] if parsed and parsed[0] == 'video' else None
     
     def extract_channel_id(self, url: str) -> Optional[str]:
         """Extract channel ID from YouTube URL"""
-        patterns = [
-            r'(?:https?://)?(?:www\.)?youtube\.com/channel/([^/\n?#]+)',
-            r'(?:https?://)?(?:www\.)?youtube\.com/c/([^/\n?#]+)',
-            r'(?:https?://)?(?:www\.)?youtube\.com/user/([^/\n?#]+)',
-            r'(?:https?://)?(?:www\.)?youtube\.com/@([^/\n?#]+)',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, url)
-            if match:
-                return match.group(1)
-        return None
+        parsed = parse_youtube_url(url)
+        return parsed[1] if parsed and parsed[0] == 'channel' else None
     
-    def get_video_info(self, video_id: str) -> Dict:
+    def get_video_info(self, video_id: str) -> VideoInfo:
         """Get video information using yt-dlp"""
+        cached = self._cache_get(f"info_{video_id}")
+        if cached is not None:
+            return VideoInfo(**cached)
+        
         try:
             ydl_opts = {
                 'quiet': True,
                 'no_warnings': True,
                 'extract_flat': True,
+                # Spaces out requests when several workers fetch at once
+                'sleep_interval_requests': 0.3,
             }
             
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                url = f"https://www.youtube.com/watch?v={video_id}"
-                info = ydl.extract_info(url, download=False)
-                return {
-                    'title': info.get('title', 'Unknown Title'),
-                    'view_count': info.get('view_count', 0),
-                    'duration': info.get('duration', 0),
-                }
+            url = f"https://www.youtube.com/watch?v={video_id}"
+            info = self._get_ydl('info', ydl_opts).extract_info(url, download=False)
+            video_info = VideoInfo(
+                info.get('title', 'Unknown Title'),
+                info.get('view_count', 0),
+                info.get('duration', 0),
+            )
+            self._cache_set(f"info_{video_id}", video_info._asdict())
+            return video_info
         except Exception as e:
-            print(f"Error getting video info: {e}")
-            return {
-                'title': 'Unknown Title',
-                'view_count': 0,
-                'duration': 0,
-            }
+            tqdm.write(f"Error getting video info: {e}")
+            return VideoInfo('Unknown Title', 0, 0)
     
     def get_transcript(self, video_id: str) -> Tuple[str, str]:
         """Analyze video content and generate transcript using Whisper AI"""
+        cached = self._cache_get(self._transcript_key(video_id))
+        if cached is not None:
+            return cached['text'], cached['type']
+        
         try:
             timestamp = datetime.now().strftime("%H:%M:%S")
             print(f"[{timestamp}] 🤖 AI transcribing {video_id}...")
             
-            # Download audio from video
-            audio_file = self.download_audio(video_id)
-            if not audio_file:
+            # Stream audio from video
+            audio = self.download_audio(video_id)
+            if audio is None:
                 return "", "Failed to download audio from video"
             
             # Convert audio to text using Whisper
-            transcript_text = self.whisper_transcribe(audio_file)
-            
-            # Clean up temporary file
-            if os.path.exists(audio_file):
-                os.remove(audio_file)
+            transcript_text = self.whisper_transcribe(audio)
             
             if transcript_text:
                 char_count = len(transcript_text)
                 timestamp = datetime.now().strftime("%H:%M:%S")
                 print(f"[{timestamp}] ✅ AI transcribed {video_id}: {char_count} chars")
-                return transcript_text, f"AI Generated (Whisper {self.model_name})"
+                transcript_type = f"AI Generated (Whisper {self.model_name})"
+                self._cache_set(self._transcript_key(video_id),
+                                {'text': transcript_text, 'type': transcript_type})
+                return transcript_text, transcript_type
             else:
                 return "", "Could not generate transcript from audio"
                 
@@ -198,64 +430,99 @@ class YouTubeTranscriptScraper:
             print(f"[{timestamp}] ❌ Error transcribing {video_id}: {str(e)[:100]}")
             return "", f"Error generating transcript: {str(e)[:100]}"
     
-    def download_audio(self, video_id: str) -> Optional[str]:
-        """Download audio from YouTube video"""
+    def download_audio(self, video_id: str) -> Optional["np.ndarray"]:
+        """Stream audio from YouTube video straight into a decoded sample array"""
         try:
             ydl_opts = {
                 'format': 'bestaudio/best',
-                'outtmpl': '%(id)s.%(ext)s',
                 'quiet': True,
                 'no_warnings': True,
             }
             
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                url = f"https://www.youtube.com/watch?v={video_id}"
-                info = ydl.extract_info(url, download=True)
-                
-                # Find the downloaded file
-                filename = ydl.prepare_filename(info)
-                if os.path.exists(filename):
-                    return filename
-                
-                # Try different extensions
-                for ext in ['webm', 'm4a', 'mp3', 'wav']:
-                    test_file = f"{video_id}.{ext}"
-                    if os.path.exists(test_file):
-                        return test_file
-                
+            # Resolve the direct media URL and let FFmpeg read it, so the
+            # audio never touches the disk
+            ydl = self._get_ydl('download', ydl_opts)
+            url = f"https://www.youtube.com/watch?v={video_id}"
+            info = ydl.extract_info(url, download=False)
+            
+            media_url = info.get('url')
+            if not media_url:
                 return None
-                
+            
+            return _load_audio(media_url, info.get('http_headers'))
+            
         except Exception as e:
-            print(f"Error downloading audio: {e}")
+            tqdm.write(f"Error downloading audio: {e}")
             return None
     
-    def whisper_transcribe(self, audio_file: str) -> str:
-        """Convert audio file to text using Whisper AI"""
+    def whisper_transcribe(self, audio: "np.ndarray") -> str:
+        """Convert decoded audio samples to text using Whisper AI"""
         try:
-            if not self.whisper_model:
-                print("Loading Whisper model...")
+            if not self.whisper_model and self.hf_model is None:
+                tqdm.write("Loading Whisper model...")
                 if not self.load_whisper_model(self.model_name):
                     return ""
             
-            # Load and process audio with Whisper
-            result = self.whisper_model.transcribe(audio_file)
+            if self.hf_model is not None:
+                return self._hf_transcribe([audio])[0]
+            
+            # Greedy decoding with VAD so silent stretches are skipped
+            segments, _ = self.whisper_model.transcribe(
+                audio, beam_size=1, vad_filter=True, vad_parameters=VAD_PARAMETERS
+            )
             
-            # Extract text from result
-            transcript_text = result["text"].strip()
+            # Segments are generated lazily; joining them runs the decode
+            transcript_text = "".join(segment.text for segment in segments).strip()
             return transcript_text
             
         except Exception as e:
-            print(f"Error in Whisper transcription: {e}")
+            tqdm.write(f"Error in Whisper transcription: {e}")
             return ""
     
+    def _hf_transcribe(self, audios: List["np.ndarray"]) -> List[str]:
+        """Transcribe a batch with the HF/ONNX model, computing log-mel features on its device"""
+        feature_extractor = self.hf_processor.feature_extractor
+        # Same Silero VAD faster-whisper uses: cut silence before encoding
+        audios = [_drop_silence(audio) for audio in audios]
+        # Long-form (> 30 s) input keeps its full length for sequential decoding
+        inputs = feature_extractor(
+            audios, sampling_rate=SAMPLE_RATE, return_tensors="pt", device=self.hf_device,
+            truncation=False, padding="longest", return_attention_mask=True,
+        )
+        if inputs.input_features.shape[-1] < feature_extractor.nb_max_frames:
+            inputs = feature_extractor(
+                audios, sampling_rate=SAMPLE_RATE, return_tensors="pt", device=self.hf_device,
+                return_attention_mask=True,
+            )
+        if self.hf_device == "cuda":
+            inputs = inputs.to("cuda", torch.float16)
+        
+        with torch.inference_mode():
+            try:
+                generated = self.hf_model.generate(**inputs)
+            except Exception as e:
+                # A compiled encoder that fails on first use is swapped back
+                # for the eager one, instead of every transcript coming out empty
+                encoder = getattr(getattr(self.hf_model, "model", None), "encoder", None)
+                original = getattr(encoder, "_orig_mod", None)
+                if original is None:
+                    raise
+                tqdm.write(f"Compiled encoder failed ({str(e)[:100]}), using the eager one")
+                self.hf_model.model.encoder = original
+                generated = self.hf_model.generate(**inputs)
+        texts = self.hf_processor.batch_decode(generated, skip_special_tokens=True)
+        return [text.strip() for text in texts]
     
-    def get_channel_videos(self, channel_url: str, max_videos: int, video_type: str = "all") -> List[str]:
-        """Get list of video IDs from a channel"""
+    def get_channel_videos(self, channel_url: str, max_videos: int, video_type: str = "all") -> List[Tuple[str, VideoInfo]]:
+        """Get list of videos from a channel, with metadata from the same listing"""
         try:
+            # Flat playlist entries already carry title/view_count/duration,
+            # so no per-video metadata request is needed afterwards
             ydl_opts = {
                 'quiet': True,
                 'no_warnings': True,
-                'extract_flat': True,
+                'extract_flat': 'in_playlist',
+                'skip_download': True,
                 'playlist_items': f'1:{max_videos}',
             }
             
@@ -270,22 +537,58 @@ class YouTubeTranscriptScraper:
             else:
                 uploads_url = channel_url
             
-            video_ids = []
+            videos = []
             
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(uploads_url, download=False)
-                
-                if 'entries' in info:
-                    for entry in info['entries'][:max_videos]:
-                        if entry and entry.get('id'):
-                            video_ids.append(entry['id'])
-                
-            return video_ids
+            info = self._get_ydl(f'channel_{max_videos}', ydl_opts).extract_info(uploads_url, download=False)
+            entries = [entry for entry in info.get('entries') or [] if entry and entry.get('id')][:max_videos]
+            
+            # Some tabs (e.g. Shorts) list entries without full metadata; fetch
+            # those concurrently, each worker with its own info extractor
+            incomplete = [
+                entry['id'] for entry in entries
+                if entry.get('title') is None or entry.get('view_count') is None or entry.get('duration') is None
+            ]
+            fetched = {}
+            if incomplete:
+                with ThreadPoolExecutor(max_workers=METADATA_WORKERS) as pool:
+                    fetched = dict(zip(incomplete, pool.map(self.get_video_info, incomplete)))
+            
+            for entry in entries:
+                video_info = fetched.get(entry['id'])
+                videos.append((entry['id'], VideoInfo(
+                    entry.get('title') or (video_info and video_info.title) or 'Unknown Title',
+                    entry.get('view_count') or (video_info and video_info.view_count) or 0,
+                    entry.get('duration') or (video_info and video_info.duration) or 0,
+                )))
+            
+            return videos
             
         except Exception as e:
             print(f"Error getting channel videos: {e}")
             return []
     
+    def fetch_video(self, video_id: str, video_info: VideoInfo, results: queue.Queue):
+        """Download worker: fetch audio for a listed video and hand it to the consumer"""
+        audio = self.download_audio(video_id)
+        results.put((video_id, video_info, audio))
+    
+    def transcribe_batch(self, audios: List["np.ndarray"]) -> List[str]:
+        """Transcribe several decoded audios, batched on the GPU when the HF model is loaded"""
+        if not audios:
+            return []
+        
+        if self.hf_model is not None:
+            try:
+                return self._hf_transcribe(audios)
+            except Exception as e:
+                tqdm.write(f"Error in batched Whisper transcription: {e}")
+                return [""] * len(audios)
+        
+        # CTranslate2 releases the GIL, so threads overlap decoding of
+        # one video with feature extraction and VAD of the next
+        with ThreadPoolExecutor(max_workers=TRANSCRIBE_WORKERS) as pool:
+            return list(pool.map(self.whisper_transcribe, audios))
+    
     def scrape_single_video(self):
         """Scrape transcript for a single video"""
         print("\n" + "="*40)
@@ -298,19 +601,20 @@ class YouTubeTranscriptScraper:
                 print("Please enter a valid URL.")
                 continue
             
-            video_id = self.extract_video_id(url)
-            if not video_id:
+            parsed = parse_youtube_url(url)
+            if not parsed or parsed[0] != 'video':
                 print("Invalid YouTube URL. Please try again.")
                 continue
+            video_id = parsed[1]
             
             print(f"\nProcessing video: {video_id}")
             
             # Get video info
             video_info = self.get_video_info(video_id)
-            print(f"Title: {video_info['title']}")
-            print(f"Views: {video_info['view_count']:,}")
-            if video_info['duration'] > 0:
-                minutes, seconds = divmod(video_info['duration'], 60)
+            print(f"Title: {video_info.title}")
+            print(f"Views: {video_info.view_count:,}")
+            if video_info.duration > 0:
+                minutes, seconds = divmod(video_info.duration, 60)
                 print(f"Duration: {minutes}:{seconds:02d}")
             
             # Get transcript
@@ -368,52 +672,109 @@ class YouTubeTranscriptScraper:
             print("Invalid choice. Please enter 1, 2, or 3.")
         
         print(f"\nFetching videos from channel...")
-        video_ids = self.get_channel_videos(channel_url, max_videos, video_type)
+        videos = self.get_channel_videos(channel_url, max_videos, video_type)
         
-        if not video_ids:
+        if not videos:
             print("No videos found or error accessing channel.")
             return
         
-        print(f"Found {len(video_ids)} videos to process.")
+        print(f"Found {len(videos)} videos to process.")
         
         # Create CSV file
-        channel_name = channel_url.split('/')[-1].replace('@', '').replace('c/', '')
-        csv_filename = f"YouTube_Transcripts_{channel_name}_{len(video_ids)}videos.csv"
+        parsed = parse_youtube_url(channel_url)
+        if parsed and parsed[0] == 'channel':
+            channel_name = parsed[1]
+        else:
+            channel_name = channel_url.split('/')[-1].replace('@', '').replace('c/', '')
+        csv_filename = f"YouTube_Transcripts_{channel_name}_{len(videos)}videos.csv"
         csv_path = self.output_dir / csv_filename
         
         # Process videos with progress bar
         processed_count = 0
         successful_count = 0
         
-        with open(csv_path, 'w', newline='', encoding='utf-8') as csvfile:
-            fieldnames = ['Title', 'Video URL', 'View Count', 'Transcript']
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            
+        # Downloads run on a thread pool and feed a queue; this thread drains
+        # it in batches so the model is busy while the next audio downloads.
+        # Only a window of downloads is in flight at once, topped up as the
+        # queue is drained, so decoded audio never piles up in memory
+        results = queue.Queue()
+        window = DOWNLOAD_WORKERS + TRANSCRIBE_BATCH_SIZE
+        
+        # Rows go through a 1 MiB buffer rather than one write each; the file
+        # is closed (and so flushed) even on Ctrl-C, keeping finished rows
+        fieldnames = ('Title', 'Video URL', 'View Count', 'Transcript')
+        with open(csv_path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as csvfile, \
+                ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as pool, \
+                tqdm(total=len(videos), desc="Transcribing") as progress:
+            writer = csv.writer(csvfile)
+            writer.writerow(fieldnames)
             print(f"\n🚀 Starting Advanced Scraping...")
-            for i, video_id in enumerate(video_ids, 1):
-                video_url = f"https://www.youtube.com/watch?v={video_id}"
-                
-                # Get video info
-                video_info = self.get_video_info(video_id)
-                print(f"\n[{i}/{len(video_ids)}] Processing: {video_info['title'][:50]}...")
-                
-                # Get transcript
-                transcript_text, transcript_type = self.get_transcript(video_id)
-                
-                # Write to CSV
-                writer.writerow({
-                    'Title': video_info['title'],
-                    'Video URL': video_url,
-                    'View Count': video_info['view_count'],
-                    'Transcript': transcript_text if transcript_text else f"[{transcript_type}]"
-                })
+            cached_transcripts = {}
+            ready = []
+            to_fetch = []
+            for video_id, video_info in videos:
+                cached = self._cache_get(self._transcript_key(video_id))
+                if cached is not None:
+                    # Already transcribed on a previous run: skip the download
+                    cached_transcripts[video_id] = cached
+                    ready.append((video_id, video_info, None))
+                else:
+                    to_fetch.append((video_id, video_info))
+            to_fetch = iter(to_fetch)
+            
+            def fetch_more(count: int):
+                for video_id, video_info in itertools.islice(to_fetch, count):
+                    pool.submit(self.fetch_video, video_id, video_info, results)
+            
+            fetch_more(window)
+            while processed_count < len(videos):
+                if ready:
+                    batch, ready = ready, []
+                else:
+                    # Block for the first item, then take whatever else is ready
+                    batch = [results.get()]
+                    while len(batch) < TRANSCRIBE_BATCH_SIZE:
+                        try:
+                            batch.append(results.get_nowait())
+                        except queue.Empty:
+                            break
+                    fetch_more(len(batch))
                 
-                processed_count += 1
-                if transcript_text:
-                    successful_count += 1
+                downloaded = [item for item in batch if item[2] is not None]
+                transcripts = dict(zip(
+                    (video_id for video_id, _, _ in downloaded),
+                    self.transcribe_batch([audio for _, _, audio in downloaded])
+                ))
                 
-                print()  # Empty line for spacing
+                for video_id, video_info, audio in batch:
+                    processed_count += 1
+                    
+                    transcript_text = transcripts.get(video_id, "")
+                    if video_id in cached_transcripts:
+                        transcript_text = cached_transcripts[video_id]['text']
+                        transcript_type = cached_transcripts[video_id]['type']
+                    elif audio is None:
+                        transcript_type = "Failed to download audio from video"
+                    elif transcript_text:
+                        transcript_type = f"AI Generated (Whisper {self.model_name})"
+                        self._cache_set(self._transcript_key(video_id),
+                                        {'text': transcript_text, 'type': transcript_type})
+                    else:
+                        transcript_type = "Could not generate transcript from audio"
+                    
+                    # Write the CSV row, in fieldnames order
+                    writer.writerow((
+                        video_info.title,
+                        f"https://www.youtube.com/watch?v={video_id}",
+                        video_info.view_count,
+                        transcript_text if transcript_text else f"[{transcript_type}]",
+                    ))
+                    
+                    if transcript_text:
+                        successful_count += 1
+                    else:
+                        tqdm.write(f"❌ {video_info.title[:50]}: {transcript_type}")
+                    progress.update()
         
         timestamp = datetime.now().strftime("%H:%M:%S")
         print(f"\nSCRAPING COMPLETED! 🎉")
@@ -428,6 +789,15 @@ class YouTubeTranscriptScraper:
         """Main entry point"""
         choice = self.get_user_choice()
         
+        # ONNX Runtime is only offered as an alternative on CPU-only machines
+        if not torch.cuda.is_available():
+            self.backend = self.get_backend_choice()
+        
+        # Only channel mode transcribes several videos at once; a single
+        # video gets every core on one worker
+        if choice == '2':
+            self.transcribe_workers = TRANSCRIBE_WORKERS
+        
         # Get Whisper model choice
         model_choice = self.get_whisper_model_choice()
         if not self.load_whisper_model(model_choice):
@@ -13,27 +13,32 @@ import csv
 import re
 import time
 import json
+import shutil
 from pathlib import Path
+from collections import OrderedDict, deque
 from typing import List, Dict, Optional, Tuple
 from datetime import datetime, timedelta
-import queue
 import subprocess
-import pkgutil
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+import importlib.util
+import tempfile
 
 # External dependencies (auto-install when running from source)
+REQUIRED_MODULES = ('yt_dlp', 'whisper', 'torch')
+
+
+def _require(name):
+    """Check a module is installed without importing it"""
+    return importlib.util.find_spec(name) is not None
+
+
 def ensure_runtime_deps():
     """Ensure pip deps are present when running from source.
     Skips auto-install when running as a frozen EXE.
     """
     if getattr(sys, 'frozen', False):
         return  # PyInstaller EXE – deps must be bundled at build time
-    required = [
-        'yt_dlp',
-        'whisper',
-        'pydub',
-        'torch',
-    ]
-    missing = [m for m in required if pkgutil.find_loader(m) is None]
+    missing = [m for m in REQUIRED_MODULES if not _require(m)]
     if missing:
         try:
             # Try using requirements.txt for completeness
@@ -51,15 +56,113 @@ def ensure_runtime_deps():
 
 ensure_runtime_deps()
 
-try:
+# Only probe for the heavy modules here; importing them (torch alone loads
+# CUDA/MKL) is deferred to the worker thread so the window opens instantly
+_missing = [m for m in REQUIRED_MODULES if not _require(m)]
+if _missing:
+    messagebox.showerror("Missing Dependencies", f"Missing required dependency: {', '.join(_missing)}\n\nPlease install required packages using: pip install -r requirements.txt")
+    sys.exit(1)
+
+yt_dlp = None
+whisper = None
+torch = None
+np = None
+
+# Transcription backends; faster-whisper (CTranslate2) is preferred when installed.
+# "transformers" is the Hugging Face ASR pipeline, batched over 30 s chunks
+BACKENDS = ("faster-whisper", "openai-whisper", "transformers")
+DEFAULT_BACKEND = "faster-whisper" if _require('faster_whisper') else "openai-whisper"
+
+# Audio containers yt-dlp may leave in a video folder
+AUDIO_EXTENSIONS = frozenset(('webm', 'm4a', 'mp3', 'opus', 'wav'))
+
+# Downloaded videos handed to the transformers pipeline in one call
+TRANSCRIBE_BATCH_VIDEOS = 4
+
+# Silero VAD settings shared by every backend
+VAD_PARAMETERS = {"min_silence_duration_ms": 500}
+
+# Finished downloads allowed to wait for Whisper beyond those in flight
+DOWNLOAD_AHEAD = 2
+
+# Loaded models kept in memory so switching back and forth skips the reload
+MODEL_CACHE_SIZE = 2
+
+# Hugging Face repos for model names that aren't plain openai/whisper-<name>
+HF_MODEL_IDS = {"distil-large-v3": "distil-whisper/distil-large-v3"}
+# faster-whisper repos for model names its 1.0.x releases have no alias for
+CT2_MODEL_IDS = {"distil-large-v3": "Systran/faster-distil-whisper-large-v3"}
+
+
+def import_heavy_deps():
+    """Import yt-dlp, Whisper, torch and NumPy on first use (no-op afterwards)"""
+    global yt_dlp, whisper, torch, np
     import yt_dlp
     import whisper
-    import pydub
-    from pydub import AudioSegment
     import torch
-except ImportError as e:
-    messagebox.showerror("Missing Dependencies", f"Missing required dependency: {e}\n\nPlease install required packages using: pip install -r requirements.txt")
-    sys.exit(1)
+    import numpy as np
+
+
+def _load_audio(path):
+    """Decode an audio file to 16 kHz mono float32 samples with FFmpeg"""
+    # FFmpeg does the mono downmix, resampling and float conversion itself,
+    # so its output is already the array Whisper wants
+    cmd = [
+        "ffmpeg", "-nostdin", "-loglevel", "error", "-threads", "0", "-i", str(path),
+        "-f", "f32le", "-ac", "1", "-acodec", "pcm_f32le", "-ar", "16000", "-",
+    ]
+    # Read into a bytearray so the array wrapping it is writable without a copy.
+    # stderr goes to a temp file: a second pipe could fill up (e.g. per-frame
+    # errors on a corrupt download) while stdout is read, blocking both ends
+    buf = bytearray()
+    with tempfile.TemporaryFile() as errfile:
+        with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=errfile) as proc:
+            chunk = proc.stdout.read(1 << 20)
+            while chunk:
+                buf += chunk
+                chunk = proc.stdout.read(1 << 20)
+        errfile.seek(0)
+        err = errfile.read()
+    if proc.returncode != 0:
+        raise RuntimeError(f"FFmpeg failed to decode audio: {err.decode(errors='ignore')[-200:]}")
+    return np.frombuffer(buf, np.float32)
+
+
+def _drop_silence(audio):
+    """Keep only the speech regions Silero VAD finds, concatenated"""
+    # faster-whisper ships Silero VAD as ONNX; without it the audio is left as is
+    if not _require('faster_whisper'):
+        return audio
+    from faster_whisper.vad import VadOptions, get_speech_timestamps
+    
+    speech = get_speech_timestamps(audio, vad_options=VadOptions(**VAD_PARAMETERS))
+    if not speech:
+        return audio
+    return np.concatenate([audio[chunk["start"]:chunk["end"]] for chunk in speech])
+
+
+# Lines kept in the progress log before the oldest are trimmed
+MAX_LOG_LINES = 5000
+# Pending log messages kept while the UI catches up; the oldest are dropped
+MAX_PENDING_LOG = 10000
+
+# Compact JSON serializer: orjson when available, else stdlib without padding
+try:
+    import orjson
+    _dumps = orjson.dumps
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+# URL / filename patterns, compiled once at import
+_CHANNEL_RE = re.compile(r'youtube\.com/(?:channel/|c/|@|user/)')
+_CHANNEL_NAME_RE = re.compile(
+    r'youtube\.com/(?:@(?P<at>[^/?#]+)|c/(?P<c>[^/?#]+)'
+    r'|user/(?P<user>[^/?#]+)|channel/(?P<ch>[^/?#]+))'
+)
+_SANITIZE_RE = re.compile(r'[<>:"/\\|?*]')
+# watch?v=, embed/, v/, shorts/ and youtu.be links in one alternation
+_VIDEO_ID_RE = re.compile(r'(?:youtube\.com/(?:watch\?v=|embed/|v/|shorts/)|youtu\.be/)([^&\n?#]+)')
 
 
 class YouTubeTranscriptGUI:
@@ -80,21 +183,51 @@ class YouTubeTranscriptGUI:
         self.whisper_model = None
         self.model_name = "base"
         self.device = "auto"
+        self.backend = DEFAULT_BACKEND
+        # (backend, model, device) -> (model, backend, model name) as loaded, LRU order
+        self._model_cache = OrderedDict()
         # Create YouTube_Transcripts folder in the program directory
         self.base_output_dir = Path(__file__).parent / "YouTube_Transcripts"
         self.setup_output_directory()
         self.current_session_dir = None
+        self._session_dir_str = None
+        # video_id -> video info dict, reset with each new session
+        self._info_cache = {}
+        # video_id -> its folders in earlier sessions, newest first
+        self._earlier_folders = {}
+        # Per-session log of finished videos, one JSON object per line
+        self._session_jsonl = None
+        self._session_jsonl_lock = threading.Lock()
         self.keep_audio = tk.BooleanVar(value=True)
         
         # Timing variables
         self.start_time = None
         self.end_time = None
         
-        # Preferences file
+        # Preferences file (writes are debounced, see _mark_prefs_dirty)
         self.prefs_file = Path(__file__).parent / "user_preferences.json"
+        self._prefs_dirty = False
+        self._prefs_after_id = None
+        self._loading = False
         
         # Queue for thread communication
-        self.log_queue = queue.Queue()
+        self.log_queue = deque(maxlen=MAX_PENDING_LOG)
+        
+        # Audio downloads run on a persistent pool; transcription stays on the
+        # scraping thread, since a single GPU/model can only run one at a time
+        self._pool = None
+        self._pool_size = 0
+        
+        # Set by Stop; workers check it between expensive steps. Each run
+        # gets a fresh one (see start_scraping)
+        self._cancel = threading.Event()
+        # Pool futures of the current run, waited for before the run ends
+        self._run_futures = set()
+        
+        # One YoutubeDL per worker thread and kind, reused for a whole run
+        self._ydl_local = threading.local()
+        self._ydl_all = []
+        self._ydl_lock = threading.Lock()
         
         # Create GUI
         self.create_widgets()
@@ -132,6 +265,10 @@ class YouTubeTranscriptGUI:
 
     def apply_theme(self, theme: str):
         """Apply light or dark theme dynamically"""
+        # Skip restyling when the theme hasn't actually changed
+        if getattr(self, '_current_theme', None) == theme:
+            return
+        
         if theme == 'dark':
             self.colors = {
                 'bg_primary': '#121212',
@@ -208,6 +345,8 @@ class YouTubeTranscriptGUI:
                 self.log_text.configure(bg=self.colors['bg_elevated'], fg=self.colors['text_primary'])
             except Exception:
                 pass
+        
+        self._current_theme = theme
     
     def create_widgets(self):
         """Create all GUI widgets with simplified, scrollable design"""
@@ -307,7 +446,7 @@ class YouTubeTranscriptGUI:
         self.whisper_model_var = tk.StringVar(value="base")
         model_combo = ttk.Combobox(model_frame, 
                                   textvariable=self.whisper_model_var,
-                                  values=["tiny", "base", "small", "medium", "large-v3"],
+                                  values=["tiny", "base", "small", "medium", "large-v3", "distil-large-v3"],
                                   state="readonly",
                                   width=12,
                                   style='Neo.TCombobox')
@@ -328,8 +467,30 @@ class YouTubeTranscriptGUI:
                                    style='Neo.TCombobox')
         device_combo.pack(side='right')
         
+        # Backend
+        backend_frame = ttk.Frame(section_frame, style='Neo.TFrame')
+        backend_frame.pack(fill='x', pady=(0, 8))
+        
+        ttk.Label(backend_frame, text="Backend:", style='Info.TLabel').pack(side='left')
+        
+        self.backend_var = tk.StringVar(value=DEFAULT_BACKEND)
+        backend_combo = ttk.Combobox(backend_frame, 
+                                    textvariable=self.backend_var,
+                                    values=list(BACKENDS),
+                                    state="readonly",
+                                    width=12,
+                                    style='Neo.TCombobox')
+        backend_combo.pack(side='right')
+        
+        # Fast mode: torch.compile the encoder (first transcription pays the compile)
+        self.fast_mode = tk.BooleanVar(value=False)
+        ttk.Checkbutton(section_frame, 
+                       text="⚡ Fast mode (torch.compile)", 
+                       variable=self.fast_mode,
+                       style='Neo.TCheckbutton').pack(anchor='w', pady=(0, 8))
+        
         # Compact model guide
-        guide_text = "tiny=fast, base=balanced, small=accurate, medium/large=best"
+        guide_text = "tiny=fast, base=balanced, small=accurate, medium/large=best, distil=near-large, fast"
         guide_label = ttk.Label(section_frame, text=guide_text, style='Info.TLabel', justify='left')
         guide_label.pack(anchor='w', pady=(5, 0))
     
@@ -395,6 +556,21 @@ class YouTubeTranscriptGUI:
                                    width=8,
                                    style='Neo.TSpinbox')
         count_spinbox.pack(side='right')
+        
+        # Parallel audio downloads for channel scrapes
+        jobs_frame = ttk.Frame(section_frame, style='Neo.TFrame')
+        jobs_frame.pack(fill='x', pady=(8, 0))
+        
+        ttk.Label(jobs_frame, text="Parallel downloads:", style='Info.TLabel').pack(side='left')
+        
+        self.jobs_var = tk.StringVar(value=os.environ.get("WHISPERTUBE_WORKERS", "4"))
+        jobs_spinbox = ttk.Spinbox(jobs_frame,
+                                  from_=1,
+                                  to=16,
+                                  textvariable=self.jobs_var,
+                                  width=8,
+                                  style='Neo.TSpinbox')
+        jobs_spinbox.pack(side='right')
     
     def create_control_buttons(self, parent):
         """Create control buttons with compact design"""
@@ -440,11 +616,20 @@ class YouTubeTranscriptGUI:
     
     def setup_logging(self):
         """Setup logging system"""
-        self.check_log_queue()
+        # The queue is drained on demand from an idle callback rather than polled
+        self._log_lock = threading.Lock()
+        self._log_scheduled = False
+        self._last_ts_sec = None
+        self._last_ts_str = ""
     
     def log_message(self, message):
         """Add message to log queue"""
-        self.log_queue.put(message)
+        self.log_queue.append(message)
+        with self._log_lock:
+            if self._log_scheduled:
+                return
+            self._log_scheduled = True
+        self.root.after_idle(self._drain_log_queue)
     
     def format_duration(self, seconds):
         """Format duration in a human-readable way"""
@@ -464,19 +649,45 @@ class YouTubeTranscriptGUI:
                 "output_directory": str(self.base_output_dir),
                 "whisper_model": self.whisper_model_var.get(),
                 "device": self.device_var.get(),
+                "backend": self.backend_var.get(),
                 "transcription_method": self.transcription_method.get(),
                 "content_type": self.content_type.get(),
                 "theme": self.theme_var.get(),
                 "video_count": self.video_count_var.get(),
-                "keep_audio": self.keep_audio.get()
+                "jobs": self.jobs_var.get(),
+                "keep_audio": self.keep_audio.get(),
+                "fast_mode": self.fast_mode.get()
             }
             
-            with open(self.prefs_file, 'w', encoding='utf-8') as f:
-                json.dump(prefs, f, indent=2)
+            # Write to a temp file and swap it in, so a crash mid-write
+            # never leaves a truncated prefs file behind
+            fd, tmp_path = tempfile.mkstemp(dir=self.prefs_file.parent, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(_dumps(prefs))
+                os.replace(tmp_path, self.prefs_file)
+            except Exception:
+                os.unlink(tmp_path)
+                raise
                 
         except Exception as e:
             self.log_message(f"⚠️ Could not save preferences: {e}")
     
+    def _mark_prefs_dirty(self):
+        """Schedule a preferences write, coalescing bursts of changes into one"""
+        if self._loading:
+            return
+        self._prefs_dirty = True
+        if self._prefs_after_id is None:
+            self._prefs_after_id = self.root.after(500, self._flush_prefs)
+    
+    def _flush_prefs(self):
+        """Write preferences if anything changed since the last write"""
+        self._prefs_after_id = None
+        if self._prefs_dirty:
+            self._prefs_dirty = False
+            self.save_preferences()
+    
     def load_preferences(self):
         """Load user preferences from file"""
         try:
@@ -484,74 +695,109 @@ class YouTubeTranscriptGUI:
                 with open(self.prefs_file, 'r', encoding='utf-8') as f:
                     prefs = json.load(f)
                 
+                # Setting the variables fires their traces; don't write the
+                # file we are reading back to disk
+                self._loading = True
+                
                 # Apply loaded preferences
+                table = [
+                    ("whisper_model", self.whisper_model_var),
+                    ("device", self.device_var),
+                    ("backend", self.backend_var),
+                    ("transcription_method", self.transcription_method),
+                    ("content_type", self.content_type),
+                    ("video_count", self.video_count_var),
+                    ("jobs", self.jobs_var),
+                ]
+                for key, var in table:
+                    if key in prefs:
+                        var.set(prefs[key])
+                
                 if "output_directory" in prefs:
                     self.base_output_dir = Path(prefs["output_directory"])
                     self.folder_var.set(str(self.base_output_dir))
                 
-                if "whisper_model" in prefs:
-                    self.whisper_model_var.set(prefs["whisper_model"])
-                
-                if "device" in prefs:
-                    self.device_var.set(prefs["device"])
-                
-                if "transcription_method" in prefs:
-                    self.transcription_method.set(prefs["transcription_method"])
-                
-                if "content_type" in prefs:
-                    self.content_type.set(prefs["content_type"])
-                
                 if "theme" in prefs:
                     self.theme_var.set(prefs["theme"])
                     self.apply_theme(self.theme_var.get())
                 
-                if "video_count" in prefs:
-                    self.video_count_var.set(prefs["video_count"])
-                
                 if "keep_audio" in prefs:
-                    self.keep_audio.set(prefs["keep_audio"])
+                    self.keep_audio.set(bool(prefs["keep_audio"]))
+                if "fast_mode" in prefs:
+                    self.fast_mode.set(bool(prefs["fast_mode"]))
                 
                 self.log_message("✅ Preferences loaded successfully")
                 
         except Exception as e:
             self.log_message(f"⚠️ Could not load preferences: {e}")
             # Use defaults if loading fails
+        finally:
+            self._loading = False
     
     def on_closing(self):
         """Handle window closing - save preferences and close"""
+        if self._prefs_after_id is not None:
+            self.root.after_cancel(self._prefs_after_id)
+            self._prefs_after_id = None
         self.save_preferences()
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+        with self._session_jsonl_lock:
+            if self._session_jsonl is not None:
+                self._session_jsonl.close()
+                self._session_jsonl = None
         self.root.destroy()
     
     def setup_preference_saving(self):
         """Set up automatic preference saving when settings change"""
         # Add trace callbacks to save preferences when values change
-        self.whisper_model_var.trace('w', lambda *args: self.save_preferences())
-        self.device_var.trace('w', lambda *args: self.save_preferences())
-        self.transcription_method.trace('w', lambda *args: self.save_preferences())
-        self.content_type.trace('w', lambda *args: self.save_preferences())
-        self.video_count_var.trace('w', lambda *args: self.save_preferences())
-        self.keep_audio.trace('w', lambda *args: self.save_preferences())
-        self.theme_var.trace('w', lambda *args: (self.apply_theme(self.theme_var.get()), self.save_preferences()))
+        self.whisper_model_var.trace('w', lambda *args: self._mark_prefs_dirty())
+        self.device_var.trace('w', lambda *args: self._mark_prefs_dirty())
+        self.backend_var.trace('w', lambda *args: self._mark_prefs_dirty())
+        self.transcription_method.trace('w', lambda *args: self._mark_prefs_dirty())
+        self.content_type.trace('w', lambda *args: self._mark_prefs_dirty())
+        self.video_count_var.trace('w', lambda *args: self._mark_prefs_dirty())
+        self.jobs_var.trace('w', lambda *args: self._mark_prefs_dirty())
+        self.keep_audio.trace('w', lambda *args: self._mark_prefs_dirty())
+        self.fast_mode.trace('w', lambda *args: self._mark_prefs_dirty())
+        # The theme itself is applied by on_theme_change (combobox binding)
+        self.theme_var.trace('w', lambda *args: self._mark_prefs_dirty())
 
     def on_theme_change(self):
         """Handle theme change from UI control"""
+        # Saving is handled by the theme_var trace
         self.apply_theme(self.theme_var.get())
-        self.save_preferences()
     
-    def check_log_queue(self):
-        """Check and process log queue"""
+    def _drain_log_queue(self):
+        """Flush every queued log message to the log widget"""
+        # Clear the flag first so messages queued mid-drain schedule a new pass
+        with self._log_lock:
+            self._log_scheduled = False
+        
+        messages = []
         try:
             while True:
-                message = self.log_queue.get_nowait()
-                timestamp = datetime.now().strftime("%H:%M:%S")
-                formatted_message = f"[{timestamp}] {message}\n"
-                self.log_text.insert(tk.END, formatted_message)
-                self.log_text.see(tk.END)
-        except queue.Empty:
+                messages.append(self.log_queue.popleft())
+        except IndexError:
             pass
         
-        # Schedule next check
-        self.root.after(100, self.check_log_queue)
+        if messages:
+            # One timestamp (reformatted at most once a second) and one
+            # widget update for the whole batch
+            now = int(time.time())
+            if now != self._last_ts_sec:
+                self._last_ts_str = time.strftime("%H:%M:%S", time.localtime(now))
+                self._last_ts_sec = now
+            timestamp = self._last_ts_str
+            chunk = "".join(f"[{timestamp}] {message}\n" for message in messages)
+            self.log_text.insert(tk.END, chunk)
+            
+            # Drop the oldest lines so the log can't grow without bound
+            line_count = int(self.log_text.index('end-1c').split('.')[0])
+            if line_count > MAX_LOG_LINES:
+                self.log_text.delete('1.0', f'{line_count - MAX_LOG_LINES + 1}.0')
+            
+            self.log_text.see(tk.END)
     
     def clear_log(self):
         """Clear the progress log"""
@@ -576,15 +822,17 @@ class YouTubeTranscriptGUI:
         self.start_button.config(state='disabled')
         self.stop_button.config(state='normal')
         
-        # Start scraping in separate thread
+        # Start scraping in separate thread, with its own cancel flag
+        self._cancel = threading.Event()
         self.scraping_thread = threading.Thread(target=self.run_scraping, daemon=True)
         self.scraping_thread.start()
     
     def stop_scraping(self):
         """Stop the scraping process"""
-        self.start_button.config(state='normal')
+        # Buttons are reset by run_scraping once the worker actually exits
+        self._cancel.set()
         self.stop_button.config(state='disabled')
-        self.log_message("❌ Scraping stopped by user")
+        self.log_message("❌ Scraping stopped by user, finishing current step...")
     
     def run_scraping(self):
         """Run the actual scraping process"""
@@ -596,13 +844,17 @@ class YouTubeTranscriptGUI:
             url = self.url_var.get().strip()
             video_count = int(self.video_count_var.get())
             
+            import_heavy_deps()
+            
             # Load Whisper model
             model_name = self.whisper_model_var.get()
-            self.log_message(f"Loading Whisper model: {model_name}")
             
-            if not self.load_whisper_model(model_name):
+            if not self.load_whisper_model(model_name, self.device_var.get(), self.backend_var.get(),
+                                           self.fast_mode.get()):
                 self.log_message("❌ Failed to load Whisper model")
                 return
+            if self._cancel.is_set():
+                return
             
             # Determine if it's a single video or channel
             if self.is_channel_url(url):
@@ -620,6 +872,13 @@ class YouTubeTranscriptGUI:
                 self.log_message(f"⏱️ Total time taken: {self.format_duration(duration)}")
                 self.log_message(f"⏰ Finished at: {datetime.now().strftime('%H:%M:%S')}")
             
+            # Downloads still running on the pool belong to this run: let
+            # them finish before their YoutubeDLs close and Start comes back
+            for future in self._run_futures:
+                future.cancel()
+            wait(self._run_futures)
+            self._run_futures.clear()
+            self._close_ydls()
             self.root.after(0, self.reset_buttons)
     
     def reset_buttons(self):
@@ -629,13 +888,7 @@ class YouTubeTranscriptGUI:
     
     def is_channel_url(self, url):
         """Check if URL is a channel URL"""
-        channel_patterns = [
-            r'youtube\.com/channel/',
-            r'youtube\.com/c/',
-            r'youtube\.com/@',
-            r'youtube\.com/user/'
-        ]
-        return any(re.search(pattern, url) for pattern in channel_patterns)
+        return _CHANNEL_RE.search(url) is not None
     
     def create_session_folder(self, channel_name=None, is_single_video=False):
         """Create organized folder structure for scraping session"""
@@ -648,103 +901,316 @@ class YouTubeTranscriptGUI:
         if is_single_video:
             # For single videos, we need to get the channel name from the video
             if channel_name and channel_name != "single_video":
-                clean_name = re.sub(r'[<>:"/\\|?*]', '_', channel_name)
+                clean_name = _SANITIZE_RE.sub('_', channel_name)
                 session_name = f"single_video_{clean_name}_{timestamp}"
             else:
                 session_name = f"single_video_unknown_{timestamp}"
         elif channel_name:
             # Clean channel name for folder name
-            clean_name = re.sub(r'[<>:"/\\|?*]', '_', channel_name)
+            clean_name = _SANITIZE_RE.sub('_', channel_name)
             session_name = f"channel_{clean_name}_{timestamp}"
         else:
             session_name = f"session_{timestamp}"
         
         self.current_session_dir = self.base_output_dir / session_name
-        self.current_session_dir.mkdir(exist_ok=True)
+        self.current_session_dir.mkdir(parents=True, exist_ok=True)
+        self._session_dir_str = str(self.current_session_dir)
+        self._info_cache.clear()
+        self._earlier_folders = self._index_earlier_folders()
+        
+        # Unbuffered append: each record is one write, so a crash mid-run
+        # keeps every line already written
+        with self._session_jsonl_lock:
+            if self._session_jsonl is not None:
+                self._session_jsonl.close()
+            self._session_jsonl = open(self.current_session_dir / "session.jsonl", 'ab', buffering=0)
         
-        self.log_message(f"📁 Created session folder: {self.current_session_dir.name}")
+        self.log_message(f"📁 Created session folder: {session_name}")
         return self.current_session_dir
     
+    def _index_earlier_folders(self):
+        """Map video IDs to their folders in earlier sessions, newest first"""
+        folders = {}
+        try:
+            with os.scandir(self.base_output_dir) as entries:
+                sessions = [entry for entry in entries
+                            if entry.is_dir() and entry.path != self._session_dir_str]
+        except OSError:
+            return folders
+        sessions.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
+        for session in sessions:
+            try:
+                with os.scandir(session.path) as entries:
+                    for entry in entries:
+                        # Video folders are named {11-char video ID}_{title}
+                        if entry.is_dir() and entry.name[11:12] == '_':
+                            folders.setdefault(entry.name[:11], []).append(Path(entry.path))
+            except OSError:
+                continue
+        return folders
+    
+    def _transcribed_with(self):
+        """Metadata line naming the backend and model that make this run's transcripts"""
+        return f"Transcribed With: {self.backend} {self.model_name}\n"
+    
+    def _earlier_transcript(self, video_id):
+        """Return a non-empty transcript of video_id from an earlier session, if any.
+        Only transcripts made with the current backend and model count.
+        """
+        transcribed_with = self._transcribed_with()
+        for folder in self._earlier_folders.get(video_id, ()):
+            transcript_file = self._existing_file(folder / f"{video_id}_transcript.txt")
+            if not transcript_file:
+                continue
+            try:
+                metadata = (folder / f"{video_id}_metadata.txt").read_text(encoding='utf-8')
+            except OSError:
+                continue
+            if transcribed_with in metadata:
+                return transcript_file
+        return None
+    
+    def append_session_record(self, record):
+        """Append one finished video to the session's session.jsonl"""
+        line = _dumps(record) + b"\n"
+        with self._session_jsonl_lock:
+            if self._session_jsonl is not None:
+                self._session_jsonl.write(line)
+    
     def create_video_folder(self, video_id, video_title):
         """Create individual folder for each video"""
-        # Clean video title for folder name
-        clean_title = re.sub(r'[<>:"/\\|?*]', '_', video_title)
-        clean_title = clean_title[:50]  # Limit length
-        video_folder_name = f"{video_id}_{clean_title}"
+        # Clean video title for folder name (length limited)
+        clean_title = _SANITIZE_RE.sub('_', video_title)[:50]
         
-        video_folder = self.current_session_dir / video_folder_name
-        video_folder.mkdir(exist_ok=True)
+        video_folder = os.path.join(self._session_dir_str, f"{video_id}_{clean_title}")
+        os.makedirs(video_folder, exist_ok=True)
         
-        return video_folder
+        return Path(video_folder)
     
     def extract_channel_name(self, channel_url):
         """Extract channel name from URL"""
-        try:
-            # Try to get channel name from URL
-            if '@' in channel_url:
-                return channel_url.split('@')[-1].split('/')[0]
-            elif '/c/' in channel_url:
-                return channel_url.split('/c/')[-1].split('/')[0]
-            elif '/user/' in channel_url:
-                return channel_url.split('/user/')[-1].split('/')[0]
-            elif '/channel/' in channel_url:
-                return f"channel_{channel_url.split('/channel/')[-1].split('/')[0]}"
-            else:
-                return "unknown_channel"
-        except:
+        match = _CHANNEL_NAME_RE.search(channel_url)
+        if not match:
             return "unknown_channel"
+        if match.group('ch'):
+            return f"channel_{match.group('ch')}"
+        return match.group('at') or match.group('c') or match.group('user')
     
-    def save_video_metadata(self, video_id, video_folder):
+    def save_video_metadata(self, video_id, video_folder, video_info=None):
         """Save video metadata to video folder"""
         try:
-            video_info = self.get_video_info(video_id)
+            if video_info is None:
+                video_info = self.get_video_info(video_id)
             metadata_file = video_folder / f"{video_id}_metadata.txt"
             
-            with open(metadata_file, 'w', encoding='utf-8') as f:
-                f.write(f"Video ID: {video_id}\n")
-                f.write(f"Title: {video_info['title']}\n")
-                f.write(f"View Count: {video_info['view_count']:,}\n")
-                f.write(f"Duration: {video_info['duration']} seconds\n")
-                f.write(f"Uploader: {video_info['uploader']}\n")
-                f.write(f"Upload Date: {video_info['upload_date']}\n")
-                f.write(f"Description: {video_info['description']}\n")
-                f.write(f"Video URL: https://www.youtube.com/watch?v={video_id}\n")
-                f.write(f"Processing Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+            metadata_file.write_text(
+                f"Video ID: {video_id}\n"
+                f"Title: {video_info['title']}\n"
+                f"View Count: {video_info['view_count']:,}\n"
+                f"Duration: {video_info['duration']} seconds\n"
+                f"Uploader: {video_info['uploader']}\n"
+                f"Upload Date: {video_info['upload_date']}\n"
+                f"Description: {video_info['description']}\n"
+                f"Video URL: https://www.youtube.com/watch?v={video_id}\n"
+                f"Processing Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+                f"{self._transcribed_with()}",
+                encoding='utf-8'
+            )
             
             self.log_message(f"💾 Saved metadata to: {metadata_file.name}")
             
         except Exception as e:
             self.log_message(f"⚠️ Could not save metadata: {e}")
     
-    def load_whisper_model(self, model_name):
-        """Load Whisper model"""
+    def resolve_device(self, device):
+        """Turn the device selection into a concrete torch device name"""
+        if device == "auto":
+            return "cuda" if torch.cuda.is_available() else "cpu"
+        return device
+    
+    def load_whisper_model(self, model_name, device="auto", backend=DEFAULT_BACKEND, fast_mode=False):
+        """Load Whisper model, reusing the loaded one if nothing changed"""
         try:
-            self.whisper_model = whisper.load_model(model_name)
+            device = self.resolve_device(device)
+            # Fast mode is toggled on the cached model in place, so it isn't
+            # part of the key and never holds a second copy of the weights
+            key = (backend, model_name, device)
+            if key in self._model_cache:
+                self._model_cache.move_to_end(key)
+                self.whisper_model, self.backend, self.model_name = self._model_cache[key]
+                self.device = device
+                self._set_fast_mode(self.backend, fast_mode)
+                self.log_message(f"✅ Reusing loaded Whisper model '{model_name}' ({backend}, {device})")
+                return True
+            
+            # Make room first, so the new weights never share VRAM with a
+            # model that is about to be dropped anyway
+            self.whisper_model = None
+            self._evict_models(MODEL_CACHE_SIZE - 1)
+            
+            self.log_message(f"Loading Whisper model: {model_name} ({backend}, {device})")
+            if backend == "faster-whisper":
+                try:
+                    from faster_whisper import WhisperModel
+                except ImportError:
+                    self.log_message("⚠️ faster-whisper is not installed, using openai-whisper")
+                    backend = "openai-whisper"
+            elif backend == "transformers" and not _require('transformers'):
+                self.log_message("⚠️ transformers is not installed, using openai-whisper")
+                backend = "openai-whisper"
+            
+            if backend == "openai-whisper" and model_name.startswith("distil-"):
+                # openai-whisper has no distilled checkpoints
+                self.log_message(f"⚠️ {model_name} needs faster-whisper or transformers, using large-v3")
+                model_name = "large-v3"
+            
+            if backend == "transformers":
+                precision = "FP16" if device == "cuda" else "FP32"
+                self.whisper_model = self._load_transformers_pipeline(model_name, device)
+            elif backend == "faster-whisper":
+                # CTranslate2 with INT8 weights (FP16 activations on CUDA). On CPU
+                # use every core; CTranslate2 defaults to 4 threads. One worker,
+                # since only the scraping thread transcribes
+                precision = "int8_float16" if device == "cuda" else "int8"
+                cpu_threads = 0 if device == "cuda" else (os.cpu_count() or 4)
+                self.whisper_model = WhisperModel(CT2_MODEL_IDS.get(model_name, model_name),
+                                                  device=device, compute_type=precision,
+                                                  cpu_threads=cpu_threads, num_workers=1)
+            else:
+                if device == "cuda":
+                    # Allow TF32 matmuls on Ampere+ GPUs
+                    torch.set_float32_matmul_precision('high')
+                precision = "FP16" if device == "cuda" else "FP32"
+                self.whisper_model = whisper.load_model(model_name, device=device)
+            
+            self._set_fast_mode(backend, fast_mode)
+            
             self.model_name = model_name
-            self.log_message(f"✅ Whisper model '{model_name}' loaded successfully")
+            self.device = device
+            self.backend = backend
+            self._model_cache[key] = (self.whisper_model, backend, model_name)
+            self.log_message(f"✅ Whisper model '{model_name}' loaded successfully ({backend}, {precision})")
             return True
         except Exception as e:
             self.log_message(f"❌ Error loading Whisper model: {e}")
             return False
     
+    def _set_fast_mode(self, backend, enabled):
+        """Wrap the loaded model's audio encoder in torch.compile, or unwrap it.
+        Returns True if a compiled encoder was unwrapped.
+        """
+        # Only the encoder: its input is always a 30 s window, so it compiles
+        # once, while the KV-cached decoder would keep recompiling
+        if backend == "faster-whisper":
+            if enabled:
+                self.log_message("ℹ️ Fast mode does not apply to faster-whisper (already compiled C++)")
+            return False
+        
+        owner = self.whisper_model.model.model if backend == "transformers" else self.whisper_model
+        # A compiled module keeps the original as _orig_mod
+        original = getattr(owner.encoder, '_orig_mod', None)
+        if not enabled:
+            if original is None:
+                return False
+            owner.encoder = original
+            return True
+        
+        if original is not None:
+            return False
+        if not hasattr(torch, 'compile'):
+            self.log_message("ℹ️ Fast mode needs PyTorch 2.x, skipping")
+        elif not _require('triton'):
+            # Compilation is lazy and would only fail on the first transcription
+            self.log_message("ℹ️ Fast mode needs Triton (not available on Windows), skipping")
+        else:
+            owner.encoder = torch.compile(owner.encoder)
+            self.log_message("⚡ Fast mode: encoder compiled, first transcription will be slower")
+        return False
+    
+    def _run_model(self, call):
+        """Run a model call, dropping a compiled encoder that fails on first use"""
+        try:
+            return call()
+        except Exception as e:
+            if not self._set_fast_mode(self.backend, False):
+                raise
+            self.log_message(f"⚠️ Fast mode failed ({str(e)[:100]}), continuing without it")
+            return call()
+    
+    def _evict_models(self, limit=MODEL_CACHE_SIZE):
+        """Drop least recently used models beyond limit"""
+        evicted = False
+        while len(self._model_cache) > limit:
+            key, _entry = self._model_cache.popitem(last=False)
+            del _entry
+            evicted = True
+            self.log_message(f"🗑️ Unloaded Whisper model '{key[1]}' ({key[0]}, {key[2]})")
+        if evicted and torch.cuda.is_available():
+            # Hand the freed blocks back to the driver rather than the caching allocator
+            torch.cuda.empty_cache()
+    
+    def _load_transformers_pipeline(self, model_name, device):
+        """Build a Hugging Face ASR pipeline for the given Whisper size"""
+        from transformers import pipeline
+        
+        model_kwargs = {"low_cpu_mem_usage": True, "use_safetensors": True}
+        if device == "cuda":
+            # Flash-Attention 2 when installed, else PyTorch's fused SDPA kernels
+            attn = "flash_attention_2" if _require('flash_attn') else "sdpa"
+            model_kwargs["attn_implementation"] = attn
+            self.log_message(f"⚡ Attention implementation: {attn}")
+        
+        return pipeline(
+            "automatic-speech-recognition",
+            model=HF_MODEL_IDS.get(model_name, f"openai/whisper-{model_name}"),
+            torch_dtype=torch.float16 if device == "cuda" else torch.float32,
+            device="cuda:0" if device == "cuda" else "cpu",
+            model_kwargs=model_kwargs,
+        )
+    
     def extract_video_id(self, url):
         """Extract video ID from YouTube URL"""
-        patterns = [
-            r'(?:https?://)?(?:www\.)?youtube\.com/watch\?v=([^&\n?#]+)',
-            r'(?:https?://)?(?:www\.)?youtube\.com/embed/([^&\n?#]+)',
-            r'(?:https?://)?(?:www\.)?youtube\.com/v/([^&\n?#]+)',
-            r'(?:https?://)?youtu\.be/([^&\n?#]+)',
-            r'(?:https?://)?(?:www\.)?youtube\.com/shorts/([^&\n?#]+)',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, url)
-            if match:
-                return match.group(1)
-        return None
+        match = _VIDEO_ID_RE.search(url)
+        return match.group(1) if match else None
+    
+    def _get_ydl(self, kind, opts):
+        """Return this thread's YoutubeDL for `kind`, creating it on first use"""
+        instances = getattr(self._ydl_local, 'instances', None)
+        if instances is None:
+            instances = self._ydl_local.instances = {}
+        
+        ydl = instances.get(kind)
+        if ydl is None:
+            ydl = instances[kind] = yt_dlp.YoutubeDL(opts)
+            with self._ydl_lock:
+                self._ydl_all.append(ydl)
+        return ydl
+    
+    def _close_ydls(self):
+        """Close every YoutubeDL created during the run"""
+        with self._ydl_lock:
+            ydls, self._ydl_all = self._ydl_all, []
+            # Pool threads outlive the run, so drop their cached instances too
+            self._ydl_local = threading.local()
+        for ydl in ydls:
+            ydl.close()
+    
+    def video_info_from_entry(self, info):
+        """Build the video info dict from a yt-dlp info or playlist entry"""
+        return {
+            'title': info.get('title', 'Unknown Title'),
+            'view_count': info.get('view_count') or 0,
+            'duration': info.get('duration') or 0,
+            'uploader': info.get('uploader') or 'Unknown',
+            'upload_date': info.get('upload_date') or '',
+            'description': info.get('description', '')[:200] + '...' if info.get('description') else ''
+        }
     
     def get_video_info(self, video_id):
-        """Get video information using yt-dlp"""
+        """Get video information using yt-dlp (cached per session)"""
+        cached = self._info_cache.get(video_id)
+        if cached is not None:
+            return cached
         try:
             ydl_opts = {
                 'quiet': True,
@@ -752,17 +1218,11 @@ class YouTubeTranscriptGUI:
                 'extract_flat': True,
             }
             
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                url = f"https://www.youtube.com/watch?v={video_id}"
-                info = ydl.extract_info(url, download=False)
-                return {
-                    'title': info.get('title', 'Unknown Title'),
-                    'view_count': info.get('view_count', 0),
-                    'duration': info.get('duration', 0),
-                    'uploader': info.get('uploader', 'Unknown'),
-                    'upload_date': info.get('upload_date', ''),
-                    'description': info.get('description', '')[:200] + '...' if info.get('description') else ''
-                }
+            ydl = self._get_ydl('info', ydl_opts)
+            url = f"https://www.youtube.com/watch?v={video_id}"
+            info = ydl.extract_info(url, download=False)
+            video_info = self._info_cache[video_id] = self.video_info_from_entry(info)
+            return video_info
         except Exception as e:
             self.log_message(f"Error getting video info: {e}")
             return {
@@ -774,45 +1234,167 @@ class YouTubeTranscriptGUI:
                 'description': ''
             }
     
+    def _existing_file(self, path):
+        """Return path as a string if it exists and is non-empty, else None"""
+        try:
+            return str(path) if path.stat().st_size > 0 else None
+        except OSError:
+            return None
+    
+    def _find_audio(self, video_id, video_folder):
+        """Return the non-empty {video_id}.<audio ext> in video_folder, if any"""
+        prefix = f"{video_id}."
+        try:
+            with os.scandir(video_folder) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if (name.startswith(prefix) and name[len(prefix):] in AUDIO_EXTENSIONS
+                            and entry.stat().st_size > 0):
+                        return entry.path
+        except OSError:
+            pass
+        return None
+    
     def download_audio(self, video_id, video_folder):
         """Download audio from YouTube video to organized folder"""
         try:
+            # Audio kept by an earlier session is linked (or copied) in, so
+            # cleaning up this session's copy leaves the original alone
+            for folder in self._earlier_folders.get(video_id, ()):
+                existing = self._find_audio(video_id, folder)
+                if existing:
+                    target = video_folder / Path(existing).name
+                    try:
+                        os.link(existing, target)
+                    except OSError:
+                        shutil.copyfile(existing, target)
+                    self.log_message(f"♻️ Reusing downloaded audio: {target.name}")
+                    return str(target)
+            
             ydl_opts = {
-                'format': 'bestaudio/best',
-                'outtmpl': str(video_folder / f'{video_id}.%(ext)s'),
+                # m4a first: fragmented DASH audio benefits from parallel fragments
+                'format': 'bestaudio[ext=m4a]/bestaudio/best',
+                'concurrent_fragment_downloads': 8,
+                'http_chunk_size': 10 * 1024 * 1024,
+                'retries': 3,
+                'fragment_retries': 3,
                 'quiet': True,
                 'no_warnings': True,
             }
             
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                url = f"https://www.youtube.com/watch?v={video_id}"
-                info = ydl.extract_info(url, download=True)
-                
-                # Find the downloaded file in the video folder
-                filename = ydl.prepare_filename(info)
-                if os.path.exists(filename):
-                    return filename
-                
-                # Try different extensions in the video folder
-                for ext in ['webm', 'm4a', 'mp3', 'wav']:
-                    test_file = video_folder / f"{video_id}.{ext}"
-                    if test_file.exists():
-                        return str(test_file)
-                
-                return None
+            # The instance is shared by this thread's downloads, so point its
+            # output template at this video's folder before each call
+            ydl = self._get_ydl('download', ydl_opts)
+            ydl.params['outtmpl'] = {'default': str(video_folder / f'{video_id}.%(ext)s')}
+            url = f"https://www.youtube.com/watch?v={video_id}"
+            info = ydl.extract_info(url, download=True)
+            
+            # yt-dlp reports where it wrote the file; only scan the folder
+            # if that's missing (e.g. a postprocessor renamed it)
+            downloads = info.get('requested_downloads') or [{}]
+            filename = downloads[0].get('filepath') or ydl.prepare_filename(info)
+            if os.path.exists(filename):
+                return filename
+            return self._find_audio(video_id, video_folder)
                 
         except Exception as e:
             self.log_message(f"Error downloading audio: {e}")
             return None
     
+    def _run_pipeline(self, sample_arrays):
+        """Transcribe several waveforms with the transformers pipeline at once"""
+        # 30 s chunks from every input share batches, keeping the GPU busy
+        inputs = [{"raw": samples, "sampling_rate": 16000} for samples in sample_arrays]
+        with torch.inference_mode():
+            outputs = self._run_model(lambda: self.whisper_model(
+                inputs,
+                chunk_length_s=30,
+                batch_size=24 if self.device == "cuda" else 4,
+                return_timestamps=False,
+            ))
+        return [out["text"].strip() for out in outputs]
+    
+    def transcribe_batch(self, batch):
+        """Pre-transcribe a batch of downloads in one pipeline call.
+        Returns {video_id: text}; empty unless the transformers backend is active.
+        """
+        items = [(video_id, audio_file) for video_id, _info, _folder, audio_file in batch if audio_file]
+        if self.backend != "transformers" or len(items) < 2 or self._cancel.is_set():
+            return {}
+        
+        self.log_message(f"🤖 AI transcribing {len(items)} videos in one batch...")
+        try:
+            texts = self._run_pipeline([_drop_silence(_load_audio(audio_file)) for _, audio_file in items])
+            return {video_id: text for (video_id, _), text in zip(items, texts)}
+        except Exception as e:
+            # Fall back to transcribing the videos one by one
+            self.log_message(f"⚠️ Batch transcription failed: {e}")
+            return {}
+    
+    def _batches(self, results):
+        """Group download results for transcribe_batch"""
+        size = TRANSCRIBE_BATCH_VIDEOS if self.backend == "transformers" else 1
+        batch = []
+        for result in results:
+            if result is None:
+                continue
+            batch.append(result)
+            if len(batch) >= size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+    
+    def _with_batch_transcripts(self, results):
+        """Yield (download result, batch transcript or None) in download order"""
+        for batch in self._batches(results):
+            texts = self.transcribe_batch(batch)
+            for result in batch:
+                yield result, texts.get(result[0])
+    
     def whisper_transcribe(self, audio_file):
         """Convert audio file to text using Whisper AI"""
         try:
             if not self.whisper_model:
                 return ""
             
-            # Load and process audio with Whisper
-            result = self.whisper_model.transcribe(audio_file)
+            samples = _load_audio(audio_file)
+            
+            if self.backend != "faster-whisper":
+                # faster-whisper applies VAD itself; the others would otherwise
+                # spend encoder windows on intros, music beds and pauses
+                samples = _drop_silence(samples)
+            
+            if self.backend == "transformers":
+                return self._run_pipeline([samples])[0]
+            
+            if self.backend == "faster-whisper":
+                # Greedy decoding, with VAD so silent stretches are skipped.
+                # Segments are lazy; decoding stops at the next segment once
+                # Stop is pressed
+                segments, _info = self.whisper_model.transcribe(samples, beam_size=1, vad_filter=True,
+                                                                vad_parameters=VAD_PARAMETERS,
+                                                                without_timestamps=True)
+                texts = []
+                for segment in segments:
+                    if self._cancel.is_set():
+                        return ""
+                    texts.append(segment.text)
+                return "".join(texts).strip()
+            
+            # Whisper computes the log-Mel spectrogram on the tensor's device,
+            # so handing it a CUDA tensor keeps the STFT off the CPU
+            audio = torch.from_numpy(samples)
+            if self.device == "cuda":
+                audio = audio.to(self.device, non_blocking=True)
+            
+            # Process audio with Whisper
+            # Half precision on CUDA; on CPU whisper would warn and use FP32 anyway.
+            # Greedy is openai-whisper's default (beam_size=1 would switch it to
+            # the slower beam search decoder); timestamp tokens aren't needed
+            with torch.inference_mode():
+                result = self._run_model(lambda: self.whisper_model.transcribe(
+                    audio, fp16=self.device == "cuda", without_timestamps=True))
             
             # Extract text from result
             transcript_text = result["text"].strip()
@@ -822,36 +1404,65 @@ class YouTubeTranscriptGUI:
             self.log_message(f"Error in Whisper transcription: {e}")
             return ""
     
-    def get_transcript(self, video_id, video_folder):
-        """Get transcript for a video"""
+    def get_transcript(self, video_id, video_folder, audio_file=None, video_info=None, transcript_text=None):
+        """Get transcript for a video, downloading its audio unless already given.
+        A transcript_text from transcribe_batch skips the Whisper call.
+        """
         try:
             video_start_time = time.time()
-            self.log_message(f"🤖 AI transcribing {video_id}...")
+            
+            # A transcript from an earlier session with the same backend and
+            # model needs neither audio nor Whisper; it is copied into this
+            # session's folder
+            transcript_file = video_folder / f"{video_id}_transcript.txt"
+            earlier_transcript = self._earlier_transcript(video_id)
+            if earlier_transcript:
+                transcript_text = Path(earlier_transcript).read_text(encoding='utf-8')
+                transcript_file.write_text(transcript_text, encoding='utf-8')
+                self.save_video_metadata(video_id, video_folder, video_info)
+                self.log_message(f"♻️ Reusing transcript from an earlier session: {transcript_file.name}")
+                transcript_type = f"AI Generated (Whisper {self.model_name}, cached)"
+                self.append_session_record({
+                    "video_id": video_id,
+                    "transcript_type": transcript_type,
+                    "char_count": len(transcript_text),
+                    "seconds": round(time.time() - video_start_time, 2),
+                    "processed_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                    "transcript": transcript_text,
+                })
+                return transcript_text, transcript_type
             
             # Download audio from video to organized folder
-            audio_file = self.download_audio(video_id, video_folder)
-            if not audio_file:
-                return "", "Failed to download audio from video"
+            if audio_file is None:
+                if self._cancel.is_set():
+                    return "", "Cancelled"
+                audio_file = self.download_audio(video_id, video_folder)
+                if not audio_file:
+                    return "", "Failed to download audio from video"
+            if self._cancel.is_set():
+                return "", "Cancelled"
             
             # Convert audio to text using Whisper
-            transcript_text = self.whisper_transcribe(audio_file)
+            if transcript_text is None:
+                self.log_message(f"🤖 AI transcribing {video_id}...")
+                transcript_text = self.whisper_transcribe(audio_file)
             
             # Save transcript to video folder
             if transcript_text:
-                transcript_file = video_folder / f"{video_id}_transcript.txt"
                 with open(transcript_file, 'w', encoding='utf-8') as f:
                     f.write(transcript_text)
                 self.log_message(f"💾 Saved transcript to: {transcript_file.name}")
             
             # Save video metadata to video folder
-            self.save_video_metadata(video_id, video_folder)
+            self.save_video_metadata(video_id, video_folder, video_info)
             
             # Clean up audio file if user doesn't want to keep it
-            if not self.keep_audio.get() and os.path.exists(audio_file):
-                os.remove(audio_file)
+            audio_path = Path(audio_file)
+            if not self.keep_audio.get():
+                audio_path.unlink(missing_ok=True)
                 self.log_message(f"🗑️ Cleaned up audio file")
-            elif self.keep_audio.get():
-                self.log_message(f"💾 Kept audio file: {Path(audio_file).name}")
+            else:
+                self.log_message(f"💾 Kept audio file: {audio_path.name}")
             
             # Calculate and display video processing time
             video_duration = time.time() - video_start_time
@@ -859,7 +1470,16 @@ class YouTubeTranscriptGUI:
             if transcript_text:
                 char_count = len(transcript_text)
                 self.log_message(f"✅ AI transcribed {video_id}: {char_count} chars ({self.format_duration(video_duration)})")
-                return transcript_text, f"AI Generated (Whisper {self.model_name})"
+                transcript_type = f"AI Generated (Whisper {self.model_name})"
+                self.append_session_record({
+                    "video_id": video_id,
+                    "transcript_type": transcript_type,
+                    "char_count": char_count,
+                    "seconds": round(video_duration, 2),
+                    "processed_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                    "transcript": transcript_text,
+                })
+                return transcript_text, transcript_type
             else:
                 self.log_message(f"❌ Failed to transcribe {video_id} ({self.format_duration(video_duration)})")
                 return "", "Could not generate transcript from audio"
@@ -892,7 +1512,7 @@ class YouTubeTranscriptGUI:
         video_folder = self.create_video_folder(video_id, video_info['title'])
         
         # Get transcript
-        transcript_text, transcript_type = self.get_transcript(video_id, video_folder)
+        transcript_text, transcript_type = self.get_transcript(video_id, video_folder, video_info=video_info)
         
         if transcript_text:
             self.log_message(f"✅ Transcript generated: {len(transcript_text)} characters")
@@ -912,14 +1532,14 @@ class YouTubeTranscriptGUI:
             self.log_message(f"🚀 Starting Advanced Scraping...")
             self.log_message(f"📺 Content type: {content_type.title()}")
             
-            # Get channel videos
-            video_ids = self.get_channel_videos(channel_url, max_videos, content_type)
+            # Get channel videos (with the metadata the listing already carries)
+            videos = self.get_channel_videos(channel_url, max_videos, content_type)
             
-            if not video_ids:
+            if not videos:
                 self.log_message("❌ No videos found or error accessing channel")
                 return
             
-            self.log_message(f"Found {len(video_ids)} videos to process")
+            self.log_message(f"Found {len(videos)} videos to process")
             
             # Get channel name for folder
             channel_name = self.extract_channel_name(channel_url)
@@ -945,40 +1565,44 @@ class YouTubeTranscriptGUI:
                     'Uploader', 'Upload Date', 'Description', 'Transcript', 
                     'Transcript Type', 'Character Count', 'Processing Date'
                 ]
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                writer.writeheader()
+                writer = csv.writer(csvfile)
+                writer.writerow(fieldnames)
                 
-                for i, video_id in enumerate(video_ids, 1):
-                    video_url = f"https://www.youtube.com/watch?v={video_id}"
-                    
-                    # Get video info
-                    video_info = self.get_video_info(video_id)
-                    self.log_message(f"[{i}/{len(video_ids)}] Processing: {video_info['title'][:50]}...")
-                    
-                    # Create video folder
-                    video_folder = self.create_video_folder(video_id, video_info['title'])
+                # Metadata and audio downloads run on the pool; this thread
+                # transcribes each download as it completes (overlapping network
+                # with GPU work) and is the only one writing CSV rows
+                for result, batch_text in self._with_batch_transcripts(self._iter_downloads(videos)):
+                    video_id, video_info, video_folder, audio_file = result
                     
-                    # Get transcript
-                    transcript_text, transcript_type = self.get_transcript(video_id, video_folder)
+                    if audio_file or self._earlier_transcript(video_id):
+                        transcript_text, transcript_type = self.get_transcript(video_id, video_folder, audio_file,
+                                                                               video_info, batch_text)
+                    else:
+                        transcript_text, transcript_type = "", "Failed to download audio from video"
+                    video_url = f"https://www.youtube.com/watch?v={video_id}"
                     
-                    # Calculate duration in minutes:seconds
-                    duration_seconds = video_info['duration']
+                    # Calculate duration in minutes:seconds (listings may give None or a float)
+                    duration_seconds = int(video_info.get('duration') or 0)
                     duration_formatted = f"{duration_seconds // 60}:{duration_seconds % 60:02d}" if duration_seconds > 0 else "Unknown"
+                    char_count = len(transcript_text) if transcript_text else 0
                     
-                    # Write to CSV with enhanced data
-                    writer.writerow({
-                        'Title': video_info['title'],
-                        'Video URL': video_url,
-                        'View Count': video_info['view_count'],
-                        'Duration (seconds)': duration_formatted,
-                        'Uploader': video_info['uploader'],
-                        'Upload Date': video_info['upload_date'],
-                        'Description': video_info['description'],
-                        'Transcript': transcript_text if transcript_text else f"[{transcript_type}]",
-                        'Transcript Type': transcript_type,
-                        'Character Count': len(transcript_text) if transcript_text else 0,
-                        'Processing Date': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                    })
+                    # Write to CSV with enhanced data (same order as fieldnames),
+                    # pushed to disk per video so a crash keeps finished rows
+                    writer.writerow((
+                        video_info['title'],
+                        video_url,
+                        video_info['view_count'],
+                        duration_formatted,
+                        video_info['uploader'],
+                        video_info['upload_date'],
+                        video_info['description'],
+                        transcript_text if transcript_text else f"[{transcript_type}]",
+                        transcript_type,
+                        char_count,
+                        datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                    ))
+                    csvfile.flush()
+                    os.fsync(csvfile.fileno())
                     
                     processed_count += 1
                     if transcript_text:
@@ -987,10 +1611,13 @@ class YouTubeTranscriptGUI:
                     self.log_message("")  # Empty line for spacing
             
             # Final results
-            self.log_message("SCRAPING COMPLETED! 🎉")
+            if self._cancel.is_set():
+                self.log_message("SCRAPING STOPPED ⏹️")
+            else:
+                self.log_message("SCRAPING COMPLETED! 🎉")
             self.log_message("📊 Results:")
             self.log_message(f"• Total videos processed: {processed_count}")
-            self.log_message(f"• Transcripts found: {successful_count}/{processed_count} ({(successful_count/processed_count)*100:.1f}%)")
+            self.log_message(f"• Transcripts found: {successful_count}/{processed_count} ({(successful_count/processed_count)*100 if processed_count else 0:.1f}%)")
             self.log_message(f"• CSV saved: {csv_path.name}")
             self.log_message(f"• Session folder: {self.current_session_dir}")
             self.log_message(f"• Individual video folders: {processed_count}")
@@ -1009,14 +1636,96 @@ class YouTubeTranscriptGUI:
         except Exception as e:
             self.log_message(f"❌ Error during channel scraping: {str(e)}")
     
+    def get_pool(self):
+        """Return the worker pool, recreating it if the job count changed"""
+        try:
+            jobs = max(1, int(self.jobs_var.get()))
+        except ValueError:
+            jobs = 4
+        
+        if self._pool is None or jobs != self._pool_size:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False)
+            self._pool = ThreadPoolExecutor(max_workers=jobs)
+            self._pool_size = jobs
+        return self._pool
+    
+    def _iter_downloads(self, videos):
+        """Yield download results as they finish, keeping only a few ahead"""
+        pool = self.get_pool()
+        # Downloads in flight plus DOWNLOAD_AHEAD finished ones waiting for
+        # Whisper, so a slow GPU doesn't let audio pile up on disk
+        window = self._pool_size + DOWNLOAD_AHEAD
+        todo = enumerate(videos, 1)
+        pending = set()
+        try:
+            while True:
+                for index, (video_id, entry) in todo:
+                    future = pool.submit(self._download_one_video, index, len(videos), video_id, entry)
+                    pending.add(future)
+                    self._run_futures.add(future)
+                    if len(pending) >= window:
+                        break
+                if not pending:
+                    return
+                
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                self._run_futures.difference_update(done)
+                for future in done:
+                    if self._cancel.is_set():
+                        return
+                    yield future.result()
+        finally:
+            # Drop queued videos on Stop; running ones bail at their next check
+            for future in pending:
+                future.cancel()
+    
+    def _download_one_video(self, index, total, video_id, entry):
+        """Fetch info and download audio for one video (runs on the pool)"""
+        if self._cancel.is_set():
+            return None
+        # The channel listing often has these already; only ask yt-dlp
+        # again when any of them is missing
+        if all(entry.get(key) is not None for key in ('title', 'duration', 'view_count', 'upload_date')):
+            video_info = self.video_info_from_entry(entry)
+        else:
+            video_info = self.get_video_info(video_id)
+        self.log_message(f"[{index}/{total}] Downloading: {video_info['title'][:50]}...")
+        
+        # Create video folder
+        video_folder = self.create_video_folder(video_id, video_info['title'])
+        
+        if self._cancel.is_set():
+            return None
+        # Nothing to download when an earlier session transcribed this video
+        if self._earlier_transcript(video_id):
+            return video_id, video_info, video_folder, None
+        audio_file = self.download_audio(video_id, video_folder)
+        return video_id, video_info, video_folder, audio_file
+    
+    def _collect_entries(self, info, max_videos):
+        """Pick (video ID, entry) pairs out of a flat playlist result"""
+        # Flat tab entries don't repeat the uploader; take it from the channel
+        uploader = info.get('uploader') or info.get('channel')
+        videos = []
+        for entry in info['entries'][:max_videos]:
+            if entry and entry.get('id'):
+                if uploader and not entry.get('uploader'):
+                    entry['uploader'] = uploader
+                videos.append((entry['id'], entry))
+        return videos
+    
     def get_channel_videos(self, channel_url, max_videos, content_type="videos"):
-        """Get list of video IDs from a channel"""
+        """Get (video ID, playlist entry) pairs from a channel"""
         try:
             ydl_opts = {
                 'quiet': True,
                 'no_warnings': True,
-                'extract_flat': True,
+                'extract_flat': 'in_playlist',
                 'playlist_items': f'1:{max_videos}',
+                # Have flat entries carry an upload_date (derived from the
+                # tab's "3 weeks ago" text), so they need no extra lookup
+                'extractor_args': {'youtubetab': {'approximate_date': ['']}},
             }
             
             # Build URL based on channel type and content type
@@ -1044,16 +1753,14 @@ class YouTubeTranscriptGUI:
             else:
                 uploads_url = channel_url
             
-            video_ids = []
+            videos = []
             
             with yt_dlp.YoutubeDL(ydl_opts) as ydl:
                 try:
                     info = ydl.extract_info(uploads_url, download=False)
                     
                     if 'entries' in info:
-                        for entry in info['entries'][:max_videos]:
-                            if entry and entry.get('id'):
-                                video_ids.append(entry['id'])
+                        videos = self._collect_entries(info, max_videos)
                 except Exception as e:
                     # If videos tab fails and we're trying "both", try shorts
                     if content_type == "both" and "videos tab" in str(e).lower():
@@ -1063,16 +1770,14 @@ class YouTubeTranscriptGUI:
                             info = ydl.extract_info(shorts_url, download=False)
                             
                             if 'entries' in info:
-                                for entry in info['entries'][:max_videos]:
-                                    if entry and entry.get('id'):
-                                        video_ids.append(entry['id'])
+                                videos = self._collect_entries(info, max_videos)
                         except Exception as shorts_error:
                             self.log_message(f"❌ Shorts also not available: {shorts_error}")
                             raise e
                     else:
                         raise e
                 
-            return video_ids
+            return videos
             
         except Exception as e:
             self.log_message(f"Error getting channel videos: {e}")